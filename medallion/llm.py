@@ -6,6 +6,7 @@ and a stub implementation for testing.
 """
 
 import uuid
+from collections.abc import Callable
 from datetime import datetime
 from typing import Protocol
 
@@ -108,6 +109,16 @@ class StubMedallionLLM:
         ```
     """
 
+    def __init__(self, clock: Callable[[], datetime] = datetime.now) -> None:
+        """
+        Initialize stub LLM.
+
+        Args:
+            clock: Callable returning the current time, used for medallion
+                   timestamps (default: datetime.now). Tests can inject a fake clock.
+        """
+        self._clock = clock
+
     async def generate(
         self,
         scope: MedallionScope,
@@ -133,10 +144,12 @@ class StubMedallionLLM:
         Raises:
             LLMError: If evidence.session_summary is empty
         """
-        if not evidence.session_summary or not evidence.session_summary.strip():
+        # isspace() avoids the string copy strip() would make
+        summary_text = evidence.session_summary
+        if not summary_text or summary_text.isspace():
             raise LLMError("Evidence session_summary cannot be empty")
 
-        now = datetime.now()
+        now = self._clock()
         medallion_id = f"med-{uuid.uuid4().hex[:12]}"
 
         meta = MedallionMeta(
@@ -189,10 +202,11 @@ class StubMedallionLLM:
         Raises:
             LLMError: If new_evidence.session_summary is empty
         """
-        if not new_evidence.session_summary or not new_evidence.session_summary.strip():
+        summary_text = new_evidence.session_summary
+        if not summary_text or summary_text.isspace():
             raise LLMError("Evidence session_summary cannot be empty")
 
-        now = datetime.now()
+        now = self._clock()
 
         # Create updated meta with new timestamp but preserved created_at
         updated_meta = MedallionMeta(
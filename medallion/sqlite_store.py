@@ -7,6 +7,9 @@ interface for persisting and retrieving medallions.
 
 import json
 import sqlite3
+from collections import OrderedDict
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -19,6 +22,113 @@ from medallion.types import (
     StoreError,
 )
 
+# Scope cache key: (graph_nodes, tags, limit). Order-insensitive, like scope matching.
+_ScopeCacheKey = tuple[frozenset[str], frozenset[str], int]
+
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_AWARE = datetime(1970, 1, 1, tzinfo=UTC)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+_CREATE_MEDALLIONS_SQL = """
+CREATE TABLE IF NOT EXISTS {table} (
+    id TEXT PRIMARY KEY,
+    content_json TEXT NOT NULL,
+    created_at INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    scope_graph_nodes TEXT NOT NULL,
+    scope_tags TEXT NOT NULL,
+    knowledge_min_ts TEXT,
+    knowledge_max_ts TEXT,
+    schema_version TEXT NOT NULL DEFAULT 'medallion.v1'
+)
+"""
+
+# Columns in _INSERT_SQL order, for copying rows between schema versions
+_SELECT_ALL_COLUMNS_SQL = """
+SELECT
+    id, content_json, created_at, updated_at, status,
+    scope_graph_nodes, scope_tags, knowledge_min_ts, knowledge_max_ts,
+    schema_version
+FROM medallions
+"""
+
+# Statement text is the sqlite3 prepared-statement cache key, so every call site
+# shares one module-level string per statement
+_INSERT_SQL = """
+INSERT INTO medallions (
+    id, content_json, created_at, updated_at, status,
+    scope_graph_nodes, scope_tags, knowledge_min_ts, knowledge_max_ts,
+    schema_version
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_SQL = """
+UPDATE medallions SET
+    content_json = ?,
+    updated_at = ?,
+    status = ?,
+    scope_graph_nodes = ?,
+    scope_tags = ?,
+    knowledge_min_ts = ?,
+    knowledge_max_ts = ?
+WHERE id = ?
+"""
+
+_SELECT_BY_ID_SQL = "SELECT content_json FROM medallions WHERE id = ?"
+
+# Room for the per-shape scope queries next to the fixed statements (sqlite3 default: 128)
+_CACHED_STATEMENTS = 256
+
+# Connection tuning for fast_mode: trades durability for write/query speed
+_FAST_MODE_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -65536",
+)
+
+
+# (medallions JSON column, side table) pairs holding normalized scope values
+_SCOPE_TABLES = (
+    ("scope_graph_nodes", "medallion_scope_nodes"),
+    ("scope_tags", "medallion_scope_tags"),
+)
+
+# (DELETE, INSERT) statements per side table, in _SCOPE_TABLES order
+_SCOPE_WRITE_SQL = tuple(
+    (
+        f"DELETE FROM {table} WHERE medallion_id = ?",
+        f"INSERT OR IGNORE INTO {table} (medallion_id, value) VALUES (?, ?)",
+    )
+    for _, table in _SCOPE_TABLES
+)
+
+
+def _to_epoch_us(value: datetime) -> int:
+    """Convert a datetime to integer microseconds since the Unix epoch.
+
+    Used for the created_at/updated_at columns so ordering is a plain integer
+    comparison. Naive datetimes are treated as UTC wall-clock time.
+    """
+    epoch = _EPOCH_NAIVE if value.tzinfo is None else _EPOCH_AWARE
+    return (value - epoch) // _ONE_MICROSECOND
+
+
+def _legacy_timestamp_to_epoch_us(value: int | str) -> int:
+    """Convert a timestamp read from a TEXT-affinity column to epoch microseconds.
+
+    Such columns hold ISO 8601 strings, plus epoch microseconds coerced to text if
+    a newer store already wrote to the database before it was migrated.
+    """
+    if isinstance(value, int):
+        return value
+    if value.lstrip("-").isdigit():
+        return int(value)
+    return _to_epoch_us(datetime.fromisoformat(value))
+
 
 class SQLiteMedallionStore:
     """SQLite-backed implementation of MedallionStore.
@@ -45,64 +155,171 @@ class SQLiteMedallionStore:
             # Query by scope
             medallions = await store.get_latest_for_scope(scope, limit=10)
         ```
+
+    Note:
+        With scope_cache_size > 0, results of get_latest_for_scope are kept in an
+        LRU cache that is cleared whenever this store writes. Cached medallions are
+        shared between callers and should be treated as read-only. Writes made
+        through another connection to the same database file are not seen until
+        this store writes or is reopened, so only enable the cache when this store
+        is the database's only writer.
     """
 
-    def __init__(self, db_path: Path | str = "medallion.db") -> None:
+    def __init__(
+        self,
+        db_path: Path | str = "medallion.db",
+        scope_cache_size: int = 0,
+        fast_mode: bool = False,
+        uri: bool = False,
+    ) -> None:
         """
         Initialize SQLite store.
 
         Args:
             db_path: Path to SQLite database file (default: "medallion.db")
                     Use ":memory:" for in-memory database (useful for testing)
+            scope_cache_size: Maximum number of get_latest_for_scope results to
+                    cache (default: 0, caching disabled). Only safe when no other
+                    connection writes to the same database.
+            fast_mode: Turn off synchronous writes and enlarge the page cache
+                    (default: False). Data may be lost on crash; intended for
+                    tests, benchmarks and throwaway databases.
+            uri: Interpret db_path as an SQLite URI (default: False), e.g.
+                    "file:name?mode=memory&cache=shared" for an in-memory database
+                    shared by every connection in the process while one stays open
 
         Raises:
             StoreError: If database initialization fails
         """
         self.db_path = str(db_path)
         self._conn: aiosqlite.Connection | None = None
+        self._scope_cache_size = scope_cache_size
+        self._fast_mode = fast_mode
+        self._uri = uri
+        self._scope_cache: OrderedDict[_ScopeCacheKey, tuple[Medallion, ...]] = OrderedDict()
 
     async def _ensure_initialized(self) -> None:
         """Ensure database connection is open and schema is created."""
         if self._conn is None:
             try:
-                self._conn = await aiosqlite.connect(self.db_path)
+                self._conn = await aiosqlite.connect(
+                    self.db_path, cached_statements=_CACHED_STATEMENTS, uri=self._uri
+                )
+                # Before foreign keys are on, so the rebuild doesn't cascade deletes
+                await self._migrate_text_timestamps()
                 await self._conn.execute("PRAGMA foreign_keys = ON")
+                if self._fast_mode:
+                    for pragma_sql in _FAST_MODE_PRAGMAS:
+                        await self._conn.execute(pragma_sql)
                 await self._create_schema()
                 await self._conn.commit()
             except sqlite3.Error as e:
                 raise StoreError(f"Failed to initialize database: {e}") from e
 
+    async def _migrate_text_timestamps(self) -> None:
+        """Rebuild a medallions table whose timestamp columns still have TEXT affinity.
+
+        Databases created before timestamps became epoch microseconds declare
+        created_at/updated_at as TEXT, so SQLite would store new integers there as
+        text that sorts below the old ISO 8601 strings. SQLite cannot change a
+        column's type in place, so the rows are copied into a table with the current
+        schema, converting each timestamp, and the new table replaces the old one.
+        """
+        assert self._conn is not None, "Connection must be initialized"
+
+        async with self._conn.execute("PRAGMA table_info(medallions)") as cursor:
+            column_types = {row[1]: row[2].upper() async for row in cursor}
+        if column_types.get("updated_at") != "TEXT":
+            return
+
+        async with self._conn.execute(_SELECT_ALL_COLUMNS_SQL) as cursor:
+            rows = await cursor.fetchall()
+        migrated_rows = [
+            (
+                row[0],
+                row[1],
+                _legacy_timestamp_to_epoch_us(row[2]),
+                _legacy_timestamp_to_epoch_us(row[3]),
+                *row[4:],
+            )
+            for row in rows
+        ]
+
+        await self._conn.execute("DROP TABLE IF EXISTS medallions_migrated")
+        await self._conn.execute(_CREATE_MEDALLIONS_SQL.format(table="medallions_migrated"))
+        await self._conn.executemany(
+            _INSERT_SQL.replace("INTO medallions", "INTO medallions_migrated", 1),
+            migrated_rows,
+        )
+        await self._conn.execute("DROP TABLE medallions")
+        await self._conn.execute("ALTER TABLE medallions_migrated RENAME TO medallions")
+        await self._conn.commit()
+
     async def _create_schema(self) -> None:
         """Create database schema if it doesn't exist."""
         assert self._conn is not None, "Connection must be initialized"
 
-        create_table_sql = """
-        CREATE TABLE IF NOT EXISTS medallions (
-            id TEXT PRIMARY KEY,
-            content_json TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            updated_at TEXT NOT NULL,
-            status TEXT NOT NULL,
-            scope_graph_nodes TEXT NOT NULL,
-            scope_tags TEXT NOT NULL,
-            knowledge_min_ts TEXT,
-            knowledge_max_ts TEXT,
-            schema_version TEXT NOT NULL DEFAULT 'medallion.v1'
-        )
-        """
-        await self._conn.execute(create_table_sql)
+        await self._conn.execute(_CREATE_MEDALLIONS_SQL.format(table="medallions"))
+
+        # Scope fields normalized into side tables so scope matching runs in SQL
+        async with self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'medallion_scope_nodes'"
+        ) as cursor:
+            needs_scope_backfill = await cursor.fetchone() is None
+
+        for column, table in _SCOPE_TABLES:
+            await self._conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    medallion_id TEXT NOT NULL REFERENCES medallions(id) ON DELETE CASCADE,
+                    value TEXT NOT NULL,
+                    PRIMARY KEY (medallion_id, value)
+                ) WITHOUT ROWID
+                """
+            )
+            if needs_scope_backfill:
+                # Databases created before the side tables existed
+                await self._conn.execute(
+                    f"""
+                    INSERT OR IGNORE INTO {table} (medallion_id, value)
+                    SELECT medallions.id, json_each.value
+                    FROM medallions, json_each(medallions.{column})
+                    """
+                )
 
         # Create indexes for efficient queries
         indexes = [
-            "CREATE INDEX IF NOT EXISTS idx_medallions_status ON medallions(status)",
-            "CREATE INDEX IF NOT EXISTS idx_medallions_updated_at ON medallions(updated_at DESC)",
-            "CREATE INDEX IF NOT EXISTS idx_medallions_scope_nodes ON medallions(scope_graph_nodes)",
-            "CREATE INDEX IF NOT EXISTS idx_medallions_scope_tags ON medallions(scope_tags)",
+            # Serves WHERE status = ? ORDER BY updated_at DESC LIMIT ? straight from the
+            # index, so SQLite walks rows newest-first and stops early instead of sorting
+            "CREATE INDEX IF NOT EXISTS idx_medallions_status_updated_at "
+            "ON medallions(status, updated_at DESC, id)",
         ]
 
         for index_sql in indexes:
             await self._conn.execute(index_sql)
 
+        # Superseded by idx_medallions_status_updated_at and the scope side tables
+        for old_index in (
+            "idx_medallions_status",
+            "idx_medallions_updated_at",
+            "idx_medallions_scope_nodes",
+            "idx_medallions_scope_tags",
+        ):
+            await self._conn.execute(f"DROP INDEX IF EXISTS {old_index}")
+
+    async def _write_scope(self, medallion: Medallion) -> None:
+        """Replace the scope side-table rows for a medallion (caller commits)."""
+        assert self._conn is not None, "Connection must be initialized"
+
+        medallion_id = medallion.meta.medallion_id
+        scope_values = (medallion.scope.graph_nodes, medallion.scope.tags)
+        for (delete_sql, insert_sql), values in zip(_SCOPE_WRITE_SQL, scope_values, strict=True):
+            await self._conn.execute(delete_sql, (medallion_id,))
+            await self._conn.executemany(
+                insert_sql,
+                [(medallion_id, value) for value in values],
+            )
+
     async def create(self, medallion: Medallion) -> None:
         """
         Persist a new medallion.
@@ -117,14 +334,7 @@ class SQLiteMedallionStore:
         await self._ensure_initialized()
         assert self._conn is not None, "Connection must be initialized"
 
-        # Validate medallion schema (Pydantic does this on instantiation, but double-check)
-        try:
-            # Serialize to validate JSON serialization works
-            json_str = medallion.model_dump_json()
-        except Exception as e:
-            raise SchemaValidationError(
-                f"Medallion schema validation failed: {e}"
-            ) from e
+        insert_params = self._insert_params(medallion)
 
         # Check if medallion already exists
         existing = await self.get_by_id(medallion.meta.medallion_id)
@@ -133,6 +343,81 @@ class SQLiteMedallionStore:
                 f"Medallion with ID {medallion.meta.medallion_id} already exists"
             )
 
+        try:
+            await self._conn.execute(_INSERT_SQL, insert_params)
+            await self._write_scope(medallion)
+            await self._conn.commit()
+            self._scope_cache.clear()
+        except sqlite3.IntegrityError as e:
+            await self._conn.rollback()
+            # Handle race condition if medallion was created between check and insert
+            raise StoreError(
+                f"Medallion with ID {medallion.meta.medallion_id} already exists"
+            ) from e
+        except sqlite3.Error as e:
+            await self._conn.rollback()
+            raise StoreError(f"Failed to create medallion: {e}") from e
+
+    async def create_many(self, medallions: Sequence[Medallion]) -> None:
+        """
+        Persist several new medallions in a single transaction.
+
+        Either every medallion is stored or none are.
+
+        Args:
+            medallions: The medallions to persist
+
+        Raises:
+            StoreError: If any medallion already exists (by ID) or persistence fails
+            SchemaValidationError: If any medallion schema validation fails
+        """
+        await self._ensure_initialized()
+        assert self._conn is not None, "Connection must be initialized"
+
+        if not medallions:
+            return
+
+        insert_params = [self._insert_params(medallion) for medallion in medallions]
+
+        try:
+            await self._conn.executemany(_INSERT_SQL, insert_params)
+            scope_values = (
+                [m.scope.graph_nodes for m in medallions],
+                [m.scope.tags for m in medallions],
+            )
+            for (_, insert_sql), values_per_medallion in zip(
+                _SCOPE_WRITE_SQL, scope_values, strict=True
+            ):
+                await self._conn.executemany(
+                    insert_sql,
+                    [
+                        (medallion.meta.medallion_id, value)
+                        for medallion, values in zip(medallions, values_per_medallion, strict=True)
+                        for value in values
+                    ],
+                )
+            await self._conn.commit()
+            self._scope_cache.clear()
+        except sqlite3.IntegrityError as e:
+            await self._conn.rollback()
+            raise StoreError(f"Failed to create medallions, duplicate ID: {e}") from e
+        except sqlite3.Error as e:
+            await self._conn.rollback()
+            raise StoreError(f"Failed to create medallions: {e}") from e
+
+    @staticmethod
+    def _insert_params(medallion: Medallion) -> tuple[Any, ...]:
+        """Serialize a medallion into the parameter tuple for an INSERT."""
+        # Validate medallion schema (Pydantic does this on instantiation, but double-check)
+        try:
+            # Serialize to validate JSON serialization works; stored compact, the
+            # model's indent=2 default is for humans reading dumps
+            json_str = medallion.model_dump_json(indent=None)
+        except Exception as e:
+            raise SchemaValidationError(
+                f"Medallion schema validation failed: {e}"
+            ) from e
+
         # Serialize scope fields for indexing
         try:
             scope_nodes_json = json.dumps(medallion.scope.graph_nodes)
@@ -142,9 +427,7 @@ class SQLiteMedallionStore:
                 f"Failed to serialize scope fields to JSON: {e}"
             ) from e
 
-        # Format timestamps as ISO 8601 strings
-        created_at_str = medallion.meta.created_at.isoformat()
-        updated_at_str = medallion.meta.updated_at.isoformat()
+        # Index timestamps as epoch microseconds; knowledge timestamps as ISO 8601 strings
         knowledge_min_str = (
             medallion.meta.knowledge_min_ts.isoformat()
             if medallion.meta.knowledge_min_ts
@@ -155,38 +438,18 @@ class SQLiteMedallionStore:
             if medallion.meta.knowledge_max_ts
             else None
         )
-
-        try:
-            insert_sql = """
-            INSERT INTO medallions (
-                id, content_json, created_at, updated_at, status,
-                scope_graph_nodes, scope_tags, knowledge_min_ts, knowledge_max_ts,
-                schema_version
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            await self._conn.execute(
-                insert_sql,
-                (
-                    medallion.meta.medallion_id,
-                    json_str,
-                    created_at_str,
-                    updated_at_str,
-                    medallion.meta.status,
-                    scope_nodes_json,
-                    scope_tags_json,
-                    knowledge_min_str,
-                    knowledge_max_str,
-                    medallion.meta.schema_version,
-                ),
-            )
-            await self._conn.commit()
-        except sqlite3.IntegrityError as e:
-            # Handle race condition if medallion was created between check and insert
-            raise StoreError(
-                f"Medallion with ID {medallion.meta.medallion_id} already exists"
-            ) from e
-        except sqlite3.Error as e:
-            raise StoreError(f"Failed to create medallion: {e}") from e
+        return (
+            medallion.meta.medallion_id,
+            json_str,
+            _to_epoch_us(medallion.meta.created_at),
+            _to_epoch_us(medallion.meta.updated_at),
+            medallion.meta.status,
+            scope_nodes_json,
+            scope_tags_json,
+            knowledge_min_str,
+            knowledge_max_str,
+            medallion.meta.schema_version,
+        )
 
     async def update(self, medallion: Medallion) -> None:
         """
@@ -204,7 +467,7 @@ class SQLiteMedallionStore:
 
         # Validate medallion schema
         try:
-            json_str = medallion.model_dump_json()
+            json_str = medallion.model_dump_json(indent=None)
         except Exception as e:
             raise SchemaValidationError(
                 f"Medallion schema validation failed: {e}"
@@ -227,7 +490,7 @@ class SQLiteMedallionStore:
             ) from e
 
         # Format timestamps (created_at is preserved, not updated)
-        updated_at_str = medallion.meta.updated_at.isoformat()
+        updated_at_us = _to_epoch_us(medallion.meta.updated_at)
         knowledge_min_str = (
             medallion.meta.knowledge_min_ts.isoformat()
             if medallion.meta.knowledge_min_ts
@@ -240,22 +503,11 @@ class SQLiteMedallionStore:
         )
 
         try:
-            update_sql = """
-            UPDATE medallions SET
-                content_json = ?,
-                updated_at = ?,
-                status = ?,
-                scope_graph_nodes = ?,
-                scope_tags = ?,
-                knowledge_min_ts = ?,
-                knowledge_max_ts = ?
-            WHERE id = ?
-            """
             await self._conn.execute(
-                update_sql,
+                _UPDATE_SQL,
                 (
                     json_str,
-                    updated_at_str,
+                    updated_at_us,
                     medallion.meta.status,
                     scope_nodes_json,
                     scope_tags_json,
@@ -264,8 +516,11 @@ class SQLiteMedallionStore:
                     medallion.meta.medallion_id,
                 ),
             )
+            await self._write_scope(medallion)
             await self._conn.commit()
+            self._scope_cache.clear()
         except sqlite3.Error as e:
+            await self._conn.rollback()
             raise StoreError(f"Failed to update medallion: {e}") from e
 
     async def get_by_id(self, medallion_id: str) -> Medallion | None:
@@ -285,8 +540,7 @@ class SQLiteMedallionStore:
         assert self._conn is not None, "Connection must be initialized"
 
         try:
-            select_sql = "SELECT content_json FROM medallions WHERE id = ?"
-            async with self._conn.execute(select_sql, (medallion_id,)) as cursor:
+            async with self._conn.execute(_SELECT_BY_ID_SQL, (medallion_id,)) as cursor:
                 row = await cursor.fetchone()
                 if row is None:
                     return None
@@ -322,78 +576,88 @@ class SQLiteMedallionStore:
 
         Raises:
             StoreError: If database query fails
+            SchemaValidationError: If a matching stored medallion fails to deserialize
         """
-        await self._ensure_initialized()
-        assert self._conn is not None, "Connection must be initialized"
-
-        # Handle edge cases
+        # Handle edge cases before touching the connection
         if limit <= 0:
             return []
 
-        # For v1, use Python-side filtering for subset matching (simpler than SQLite JSON1)
-        # Load all medallions with matching tags, then filter by graph_nodes subset
-        requested_nodes = set(scope.graph_nodes)
-        requested_tags = set(scope.tags)
+        await self._ensure_initialized()
+        assert self._conn is not None, "Connection must be initialized"
 
-        try:
-            # Query by tags first (if tags provided), then filter by graph_nodes
-            if requested_tags:
-                # Use JSON LIKE for tag matching (simple intersection)
-                # This is a basic implementation - can be optimized later
-                select_sql = """
-                SELECT content_json, scope_graph_nodes
-                FROM medallions
-                WHERE status = 'active'
-                ORDER BY updated_at DESC
-                LIMIT ?
-                """
-                async with self._conn.execute(select_sql, (limit * 5,)) as cursor:
-                    rows = await cursor.fetchall()
-            else:
-                # No tags specified, get all active medallions
-                select_sql = """
-                SELECT content_json, scope_graph_nodes
-                FROM medallions
-                WHERE status = 'active'
-                ORDER BY updated_at DESC
-                LIMIT ?
-                """
-                async with self._conn.execute(select_sql, (limit * 5,)) as cursor:
-                    rows = await cursor.fetchall()
+        cache_key: _ScopeCacheKey = (frozenset(scope.graph_nodes), frozenset(scope.tags), limit)
+        cached = self._scope_cache.get(cache_key)
+        if cached is not None:
+            self._scope_cache.move_to_end(cache_key)
+            return list(cached)
+
+        # Scope matching runs in SQL against the normalized scope tables:
+        # - graph_nodes: every requested node must be present (subset match)
+        # - tags: at least one requested tag must be present (intersection match)
+        # Rows come newest-first from the status/updated_at index and SQLite stops at
+        # LIMIT, so only the returned rows pay for full medallion hydration.
+        requested_nodes = sorted(set(scope.graph_nodes))
+        requested_tags = sorted(set(scope.tags))
+
+        conditions = ["m.status = 'active'"]
+        params: list[str | int] = []
+        for node in requested_nodes:
+            conditions.append(
+                "EXISTS (SELECT 1 FROM medallion_scope_nodes AS n "
+                "WHERE n.medallion_id = m.id AND n.value = ?)"
+            )
+            params.append(node)
+        if requested_tags:
+            placeholders = ", ".join("?" for _ in requested_tags)
+            conditions.append(
+                "EXISTS (SELECT 1 FROM medallion_scope_tags AS t "
+                f"WHERE t.medallion_id = m.id AND t.value IN ({placeholders}))"
+            )
+            params.extend(requested_tags)
+        params.append(limit)
+
+        select_sql = f"""
+        SELECT m.content_json
+        FROM medallions AS m
+        WHERE {" AND ".join(conditions)}
+        ORDER BY m.updated_at DESC
+        LIMIT ?
+        """
 
-            # Filter by scope matching (subset match for graph_nodes, intersection for tags)
+        try:
             results: list[Medallion] = []
-            for row in rows:
-                try:
-                    medallion = Medallion.model_validate_json(row[0])
-                    stored_nodes = set(medallion.scope.graph_nodes)
-                    stored_tags = set(medallion.scope.tags)
-
-                    # Subset matching for graph_nodes
-                    nodes_match = (
-                        not requested_nodes
-                        or requested_nodes.issubset(stored_nodes)
-                    )
-                    # Intersection matching for tags
-                    tags_match = (
-                        not requested_tags or bool(requested_tags & stored_tags)
-                    )
-
-                    if nodes_match and tags_match:
-                        results.append(medallion)
-                        if len(results) >= limit:
-                            break
-                except Exception:
-                    # Skip invalid medallions
-                    continue
+            async with self._conn.execute(select_sql, params) as cursor:
+                async for row in cursor:
+                    # Fail like get_by_id: skipping a bad row would silently spend a LIMIT slot
+                    try:
+                        results.append(Medallion.model_validate_json(row[0]))
+                    except Exception as e:
+                        raise SchemaValidationError(
+                            f"Failed to deserialize medallion from JSON: {e}"
+                        ) from e
+
+            if self._scope_cache_size > 0:
+                self._scope_cache[cache_key] = tuple(results)
+                if len(self._scope_cache) > self._scope_cache_size:
+                    self._scope_cache.popitem(last=False)
 
             return results
         except sqlite3.Error as e:
             raise StoreError(f"Failed to get medallions for scope: {e}") from e
 
     async def close(self) -> None:
-        """Close database connection."""
+        """Close database connection.
+
+        Runs ``PRAGMA optimize`` first, as SQLite recommends before closing a
+        connection, so planner statistics stay fresh for the next one.
+        """
+        self._scope_cache.clear()
         if self._conn is not None:
+            try:
+                await self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                # Best effort: stale statistics must not prevent closing
+                pass
             await self._conn.close()
             self._conn = None
 
@@ -5,6 +5,7 @@ This module contains all Pydantic models for the Medallion schema,
 including validation rules and custom exceptions.
 """
 
+import sys
 from datetime import datetime
 from typing import Any, Literal
 
@@ -49,6 +50,9 @@ class MedallionScope(BaseModel):
     - graph_nodes: Subset matching (requested nodes must be subset of stored nodes)
     - tags: Intersection matching (any tag overlap returns match)
 
+    Scopes are immutable and hashable: list input is stored as tuples, so a
+    scope can be used directly as a dict or cache key.
+
     Example:
         ```python
         from medallion import MedallionScope
@@ -61,15 +65,23 @@ class MedallionScope(BaseModel):
         ```
     """
 
-    graph_nodes: list[str] = Field(
-        default_factory=list,
+    model_config = ConfigDict(frozen=True)
+
+    graph_nodes: tuple[str, ...] = Field(
+        default=(),
         description="Array of graph node IDs (e.g., ['repo:muse', 'module:cli'])",
     )
-    tags: list[str] = Field(
-        default_factory=list,
+    tags: tuple[str, ...] = Field(
+        default=(),
         description="Array of tags for categorization (e.g., ['project_state', 'refactor_sprint_1'])",
     )
 
+    @field_validator("graph_nodes", "tags")
+    @classmethod
+    def intern_scope_keys(cls, v: tuple[str, ...]) -> tuple[str, ...]:
+        """Intern scope keys so repeated node IDs and tags share one string object."""
+        return tuple(sys.intern(key) for key in v)
+
 
 class MedallionDecision(BaseModel):
     """A canonical decision about the scope."""
@@ -0,0 +1,57 @@
+"""Shared pytest configuration."""
+
+import ast
+import asyncio
+from pathlib import Path
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows)
+    uvloop = None
+
+_UNIT_TESTS_DIR = Path(__file__).parent / "unit"
+
+
+def _time_sleep_calls(path: Path) -> list[int]:
+    """Return the line numbers of ``time.sleep(...)`` calls in a source file."""
+    tree = ast.parse(path.read_text(), filename=str(path))
+    return [
+        node.lineno
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "sleep"
+        and isinstance(node.func.value, ast.Name)
+        and node.func.value.id == "time"
+    ]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session: pytest.Session) -> None:
+    """Reject unit tests that sleep; inject a clock or poll for readiness instead.
+
+    Runs on the controlling process only, before any pytest-xdist worker starts.
+    """
+    if hasattr(session.config, "workerinput"):
+        return
+    offenders = [
+        f"{path.relative_to(_UNIT_TESTS_DIR.parent)}:{lineno}"
+        for path in sorted(_UNIT_TESTS_DIR.glob("test_*.py"))
+        for lineno in _time_sleep_calls(path)
+    ]
+    if offenders:
+        raise pytest.UsageError(
+            "time.sleep() is not allowed in unit tests: " + ", ".join(offenders)
+        )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Run async tests on uvloop when it is installed; stdlib asyncio otherwise.
+
+    pytest-asyncio creates its loops through the current event loop policy, so
+    setting it once here covers every loop scope without parametrizing tests.
+    """
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
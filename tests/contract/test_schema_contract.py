@@ -84,8 +84,8 @@ class TestSchemaContract:
         )
         assert hasattr(scope, "graph_nodes")
         assert hasattr(scope, "tags")
-        assert isinstance(scope.graph_nodes, list)
-        assert isinstance(scope.tags, list)
+        assert isinstance(scope.graph_nodes, tuple)
+        assert isinstance(scope.tags, tuple)
 
     def test_medallion_decision_has_required_fields(self) -> None:
         """Test that MedallionDecision has required fields from PRD."""
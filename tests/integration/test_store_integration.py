@@ -92,8 +92,8 @@ async def test_create_and_get_round_trip(
     # Verify all fields are preserved
     assert retrieved.meta.medallion_id == "med-integration-001"
     assert retrieved.meta.schema_version == "medallion.v1"
-    assert retrieved.scope.graph_nodes == ["repo:muse", "module:cli"]
-    assert retrieved.scope.tags == ["project_state", "refactor_sprint_1"]
+    assert retrieved.scope.graph_nodes == ("repo:muse", "module:cli")
+    assert retrieved.scope.tags == ("project_state", "refactor_sprint_1")
     assert retrieved.summary.high_level == "Integration test summary"
     assert len(retrieved.summary.subsystems) == 1
     assert retrieved.summary.subsystems[0].name == "Store"
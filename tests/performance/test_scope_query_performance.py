@@ -1,9 +1,11 @@
 """Performance tests for scope query operations (Phase 7 - T063)."""
 
+import statistics
 import time
 from datetime import datetime, timedelta
 
 import pytest
+import pytest_asyncio
 
 from medallion.sqlite_store import SQLiteMedallionStore
 from medallion.types import (
@@ -14,52 +16,90 @@ from medallion.types import (
     MedallionSummary,
 )
 
+MEDALLION_COUNT = 150
+_BASE_TIME = datetime(2025, 1, 1, 12, 0, 0)
+TIMESTAMPS = tuple(_BASE_TIME + timedelta(seconds=i) for i in range(MEDALLION_COUNT))
+NODE_VARIANTS = (
+    ("repo:muse", "module:cli"),
+    ("repo:muse", "module:cli", "module:store"),
+    ("repo:other", "module:api"),
+)
+TAG_VARIANTS = (("project_state",), ("refactor",))
+
+WARMUP_ITERATIONS = 5
+SAMPLE_ITERATIONS = 50
+P95_TARGET_NS = 50_000_000
+
+
+async def _measure_p95_ns(
+    store: SQLiteMedallionStore, scope: MedallionScope, limit: int
+) -> tuple[int, list[Medallion]]:
+    """Run the scope query repeatedly and return its p95 latency and last results."""
+    for _ in range(WARMUP_ITERATIONS):
+        results = await store.get_latest_for_scope(scope, limit=limit)
 
-@pytest.fixture
+    samples: list[int] = []
+    for _ in range(SAMPLE_ITERATIONS):
+        start = time.perf_counter_ns()
+        results = await store.get_latest_for_scope(scope, limit=limit)
+        samples.append(time.perf_counter_ns() - start)
+
+    return round(statistics.quantiles(samples, n=100)[94]), results
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def large_store() -> SQLiteMedallionStore:
-    """Create a store with many medallions for performance testing."""
-    store = SQLiteMedallionStore(":memory:")
-    now = datetime.now()
+    """Create a store with many medallions for performance testing.
+
+    Module-scoped: the tests below only read from the store, so the 150 inserts
+    are paid once and every measurement runs against the same page cache state.
+    """
+    # Scope cache off so repeated samples measure the SQL path, not dict lookups
+    store = SQLiteMedallionStore(":memory:", scope_cache_size=0, fast_mode=True)
 
     # Create 100+ medallions with varying scopes
-    for i in range(150):
-        # Vary graph nodes and tags
-        nodes = []
-        if i % 3 == 0:
-            nodes = ["repo:muse", "module:cli"]
-        elif i % 3 == 1:
-            nodes = ["repo:muse", "module:cli", "module:store"]
-        else:
-            nodes = ["repo:other", "module:api"]
-
-        tags = []
-        if i % 2 == 0:
-            tags = ["project_state"]
-        else:
-            tags = ["refactor"]
-
-        scope = MedallionScope(graph_nodes=nodes, tags=tags)
-        meta = MedallionMeta(
+    medallions = []
+    for i in range(MEDALLION_COUNT):
+        # Inputs are known-good, so skip Pydantic validation while building fixtures
+        scope = MedallionScope.model_construct(
+            graph_nodes=NODE_VARIANTS[i % 3], tags=TAG_VARIANTS[i % 2]
+        )
+        meta = MedallionMeta.model_construct(
             medallion_id=f"med-perf-{i:03d}",
             model="gpt-4",
-            created_at=now + timedelta(seconds=i),
-            updated_at=now + timedelta(seconds=i),
+            created_at=TIMESTAMPS[i],
+            updated_at=TIMESTAMPS[i],
         )
-        medallion = Medallion(
+        medallion = Medallion.model_construct(
             meta=meta,
             scope=scope,
-            summary=MedallionSummary(high_level=f"Performance test {i}", subsystems=[]),
+            summary=MedallionSummary.model_construct(
+                high_level=f"Performance test {i}", subsystems=[]
+            ),
             decisions=[],
             open_questions=[],
-            affordances=MedallionAffordances(),
+            affordances=MedallionAffordances.model_construct(),
         )
-        await store.create(medallion)
+        medallions.append(medallion)
+
+    # One transaction for the whole batch instead of a commit per medallion
+    await store.create_many(medallions)
+
+    # Validate one medallion so schema drift in the fixture is still caught
+    Medallion.model_validate(medallion.model_dump())
+
+    # Refresh planner statistics so queries use the updated_at index. A plain
+    # PRAGMA optimize (which close() runs) only re-analyzes tables that already
+    # have statistics, so a freshly seeded database needs an explicit ANALYZE.
+    assert store._conn is not None
+    await store._conn.execute("ANALYZE")
+    await store._conn.commit()
 
     yield store
     await store.close()
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_get_latest_for_scope_performance_with_many_medallions(
     large_store: SQLiteMedallionStore,
 ) -> None:
@@ -72,27 +112,23 @@ async def test_get_latest_for_scope_performance_with_many_medallions(
         tags=["project_state"],
     )
 
-    # Measure query time
-    start = time.perf_counter()
-    results = await large_store.get_latest_for_scope(scope, limit=10)
-    elapsed = time.perf_counter() - start
+    p95_ns, results = await _measure_p95_ns(large_store, scope, limit=10)
 
     # Verify results (subset matching means stored nodes may have more than requested)
     assert len(results) > 0
     # Verify that requested nodes are subset of stored nodes (subset matching)
+    requested_nodes = frozenset(scope.graph_nodes)
     for medallion in results:
-        requested_nodes = set(scope.graph_nodes)
-        stored_nodes = set(medallion.scope.graph_nodes)
-        assert requested_nodes.issubset(stored_nodes), f"Requested {requested_nodes} not subset of {stored_nodes}"
+        assert requested_nodes.issubset(
+            medallion.scope.graph_nodes
+        ), f"Requested {requested_nodes} not subset of {medallion.scope.graph_nodes}"
 
-    # Performance assertion: should complete in <50ms (p95 target)
-    # We use 100ms as a reasonable upper bound for 150 medallions
-    assert elapsed < 0.1, f"Query took {elapsed*1000:.2f}ms, expected <100ms"
+    assert p95_ns < P95_TARGET_NS, f"Query p95 was {p95_ns / 1e6:.2f}ms, expected <50ms"
 
-    print(f"Query completed in {elapsed*1000:.2f}ms with {len(results)} results")
+    print(f"Query p95 {p95_ns / 1e6:.2f}ms with {len(results)} results")
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_get_latest_for_scope_performance_empty_result(
     large_store: SQLiteMedallionStore,
 ) -> None:
@@ -102,18 +138,15 @@ async def test_get_latest_for_scope_performance_empty_result(
         tags=["nonexistent_tag"],
     )
 
-    start = time.perf_counter()
-    results = await large_store.get_latest_for_scope(scope, limit=10)
-    elapsed = time.perf_counter() - start
+    p95_ns, results = await _measure_p95_ns(large_store, scope, limit=10)
 
     assert len(results) == 0
-    # Empty results should be very fast
-    assert elapsed < 0.05, f"Empty query took {elapsed*1000:.2f}ms, expected <50ms"
+    assert p95_ns < P95_TARGET_NS, f"Empty query p95 was {p95_ns / 1e6:.2f}ms, expected <50ms"
 
-    print(f"Empty query completed in {elapsed*1000:.2f}ms")
+    print(f"Empty query p95 {p95_ns / 1e6:.2f}ms")
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_get_latest_for_scope_performance_with_limit(
     large_store: SQLiteMedallionStore,
 ) -> None:
@@ -123,23 +156,15 @@ async def test_get_latest_for_scope_performance_with_limit(
         tags=["project_state"],
     )
 
-    # Test with small limit
-    start = time.perf_counter()
-    results_small = await large_store.get_latest_for_scope(scope, limit=5)
-    elapsed_small = time.perf_counter() - start
-
-    # Test with larger limit
-    start = time.perf_counter()
-    results_large = await large_store.get_latest_for_scope(scope, limit=50)
-    elapsed_large = time.perf_counter() - start
+    p95_small_ns, results_small = await _measure_p95_ns(large_store, scope, limit=5)
+    p95_large_ns, results_large = await _measure_p95_ns(large_store, scope, limit=50)
 
     assert len(results_small) <= 5
     assert len(results_large) <= 50
 
     # Both should be fast, but smaller limit might be slightly faster
-    assert elapsed_small < 0.1
-    assert elapsed_large < 0.1
-
-    print(f"Small limit (5): {elapsed_small*1000:.2f}ms")
-    print(f"Large limit (50): {elapsed_large*1000:.2f}ms")
+    assert p95_small_ns < P95_TARGET_NS
+    assert p95_large_ns < P95_TARGET_NS
 
+    print(f"Small limit (5) p95: {p95_small_ns / 1e6:.2f}ms")
+    print(f"Large limit (50) p95: {p95_large_ns / 1e6:.2f}ms")
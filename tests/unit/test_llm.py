@@ -1,6 +1,8 @@
 """Unit tests for MedallionLLM stub implementation."""
 
-from datetime import datetime
+import json
+from datetime import datetime, timedelta
+from typing import Any
 
 import pytest
 
@@ -14,12 +16,18 @@ from medallion.types import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def llm() -> StubMedallionLLM:
-    """Create a stub LLM instance for testing."""
+    """Create a stub LLM instance for testing (stateless, so shared per session)."""
     return StubMedallionLLM()
 
 
+@pytest.fixture(scope="session")
+def medallion_schema() -> dict[str, Any]:
+    """Build the Medallion JSON schema once per session."""
+    return Medallion.model_json_schema()
+
+
 @pytest.fixture
 def sample_scope() -> MedallionScope:
     """Create a sample scope for testing."""
@@ -136,13 +144,14 @@ class TestStubMedallionLLMGenerate:
         llm: StubMedallionLLM,
         sample_scope: MedallionScope,
         sample_evidence: Evidence,
+        medallion_schema: dict[str, Any],
     ) -> None:
         """Test that generate returns schema-compliant medallion."""
         medallion = await llm.generate(sample_scope, sample_evidence)
-        # Verify JSON serialization works (validates schema)
-        json_str = medallion.model_dump_json()
-        assert isinstance(json_str, str)
-        assert len(json_str) > 0
+        # The module's one serialization check: the dumped JSON carries every required key
+        dumped = json.loads(medallion.model_dump_json())
+        assert set(medallion_schema["required"]) <= dumped.keys()
+        assert dumped["meta"]["schema_version"] == "medallion.v1"
 
 
 class TestStubMedallionLLMUpdate:
@@ -183,17 +192,21 @@ class TestStubMedallionLLMUpdate:
     @pytest.mark.asyncio
     async def test_update_changes_updated_at(
         self,
-        llm: StubMedallionLLM,
-        existing_medallion: Medallion,
+        sample_scope: MedallionScope,
+        sample_evidence: Evidence,
     ) -> None:
         """Test that update changes updated_at timestamp."""
-        import time
+        ticks = [datetime(2025, 1, 1)]
 
-        original_updated_at = existing_medallion.meta.updated_at
-        time.sleep(0.01)  # Small delay to ensure timestamp difference
+        def clock() -> datetime:
+            ticks[0] += timedelta(microseconds=1)
+            return ticks[0]
+
+        clocked_llm = StubMedallionLLM(clock=clock)
+        existing = await clocked_llm.generate(sample_scope, sample_evidence)
         new_evidence = Evidence(session_summary="Updated summary")
-        updated = await llm.update(existing_medallion, new_evidence)
-        assert updated.meta.updated_at > original_updated_at
+        updated = await clocked_llm.update(existing, new_evidence)
+        assert updated.meta.updated_at > existing.meta.updated_at
 
     @pytest.mark.asyncio
     async def test_update_raises_error_on_empty_summary(
@@ -226,9 +239,9 @@ class TestStubMedallionLLMUpdate:
         """Test that update returns schema-compliant medallion."""
         new_evidence = Evidence(session_summary="Updated summary")
         updated = await llm.update(existing_medallion, new_evidence)
-        # Verify JSON serialization works (validates schema)
-        json_str = updated.model_dump_json()
-        assert isinstance(json_str, str)
+        # Serialization is covered by test_generate_schema_compliance; check invariants only
+        assert updated.meta.schema_version == "medallion.v1"
+        assert updated.meta.status == "active"
 
     @pytest.mark.asyncio
     async def test_update_preserves_other_fields(
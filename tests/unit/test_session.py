@@ -1,10 +1,16 @@
 """Unit tests for session helper functions."""
 
+import asyncio
+import re
+from collections.abc import AsyncIterator, Iterator
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
 
+import medallion.session as session_module
 from medallion.llm import MedallionLLM, StubMedallionLLM
 from medallion.session import (
     _checkpoint_session_async,
@@ -12,6 +18,7 @@ from medallion.session import (
     checkpoint_session,
     load_medallions_for_scope,
 )
+from medallion.sqlite_store import SQLiteMedallionStore
 from medallion.store import MedallionStore
 from medallion.types import (
     Evidence,
@@ -25,77 +32,136 @@ from medallion.types import (
     StoreError,
 )
 
+# Every async test in this module shares one event loop (and the module-scoped store)
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+_NOW = datetime(2024, 1, 1, 0, 0, 0)
+
+# pytest.raises(match=...) accepts compiled patterns; compile each message once
+_RE_FAILED_GENERATE = re.compile("Failed to generate medallion")
+_RE_FAILED_CREATE = re.compile("Failed to create medallion")
+_RE_GENERATED_SCHEMA = re.compile("Generated medallion schema validation failed")
+_RE_FAILED_UPDATE = re.compile("Failed to update medallion")
+_RE_FAILED_STORE_UPDATE = re.compile("Failed to update medallion in store")
+_RE_UPDATED_SCHEMA = re.compile("Updated medallion schema validation failed")
+_RE_UNEXPECTED_CHECKPOINT = re.compile("Unexpected error during checkpoint_session")
+_RE_STORE_FAILED = re.compile("Store failed")
+_RE_UNEXPECTED_LOAD = re.compile("Unexpected error loading medallions")
+
+
+_STORE_METHODS = ("get_latest_for_scope", "create", "update")
+_LLM_METHODS = ("generate", "update")
+
+
+def _build_pooled_mock(method_names: tuple[str, ...]) -> MagicMock:
+    """Build a MagicMock whose named methods are AsyncMocks."""
+    mock = MagicMock()
+    for name in method_names:
+        setattr(mock, name, AsyncMock())
+    return mock
+
+
+def _reset_pooled_mock(mock: MagicMock, method_names: tuple[str, ...]) -> None:
+    """Clear call history, return values and side effects left by the previous test."""
+    for name in method_names:
+        getattr(mock, name).reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
+def _pooled_store() -> MagicMock:
+    """Store mock whose AsyncMocks are built once per module and reset per test."""
+    return _build_pooled_mock(_STORE_METHODS)
+
+
+@pytest.fixture(scope="module")
+def _pooled_llm() -> MagicMock:
+    """LLM mock whose AsyncMocks are built once per module and reset per test."""
+    return _build_pooled_mock(_LLM_METHODS)
+
 
 @pytest.fixture
-def mock_store() -> MedallionStore:
+def mock_store(_pooled_store: MagicMock) -> MedallionStore:
     """Create a mock store for testing."""
-    store = MagicMock(spec=MedallionStore)
-    store.get_latest_for_scope = AsyncMock(return_value=[])
-    store.create = AsyncMock()
-    store.update = AsyncMock()
-    return store
+    _reset_pooled_mock(_pooled_store, _STORE_METHODS)
+    _pooled_store.get_latest_for_scope.return_value = []
+    return _pooled_store
 
 
 @pytest.fixture
-def mock_llm() -> MedallionLLM:
+def mock_llm(_pooled_llm: MagicMock) -> MedallionLLM:
     """Create a mock LLM for testing."""
-    llm = MagicMock(spec=MedallionLLM)
-    llm.generate = AsyncMock()
-    llm.update = AsyncMock()
-    return llm
+    _reset_pooled_mock(_pooled_llm, _LLM_METHODS)
+    return _pooled_llm
 
 
-@pytest.fixture
+# Built once per process at import. A cross-run cache (e.g. pytest-fixture-cache)
+# would cost more in pickling and invalidation than these constructions do.
+_SAMPLE_SCOPE = MedallionScope(graph_nodes=["repo:muse"], tags=["project_state"])
+_SAMPLE_EVIDENCE = Evidence(
+    session_summary="Test session summary",
+    transcripts=[],
+    artefacts={},
+)
+
+
+@pytest.fixture(scope="module")
 def sample_scope() -> MedallionScope:
     """Create a sample scope for testing."""
-    return MedallionScope(
-        graph_nodes=["repo:muse"],
-        tags=["project_state"],
-    )
+    return _SAMPLE_SCOPE
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_evidence() -> Evidence:
     """Create sample evidence for testing."""
-    return Evidence(
-        session_summary="Test session summary",
-        transcripts=[],
-        artefacts={},
-    )
+    return _SAMPLE_EVIDENCE
 
 
-@pytest.fixture
-def sample_medallion() -> Medallion:
-    """Create a sample medallion for testing."""
-    now = datetime.now()
-    meta = MedallionMeta(
+def _build_sample_medallion() -> Medallion:
+    """Build the sample medallion without validation (inputs are known-good)."""
+    meta = MedallionMeta.model_construct(
         medallion_id="med-001",
         model="gpt-4",
-        created_at=now,
-        updated_at=now,
+        created_at=_NOW,
+        updated_at=_NOW,
     )
-    scope = MedallionScope(
-        graph_nodes=["repo:muse"],
-        tags=["project_state"],
+    scope = MedallionScope.model_construct(
+        graph_nodes=("repo:muse",),
+        tags=("project_state",),
     )
-    summary = MedallionSummary(
+    summary = MedallionSummary.model_construct(
         high_level="Test summary",
         subsystems=[],
     )
-    return Medallion(
+    return Medallion.model_construct(
         meta=meta,
         scope=scope,
         summary=summary,
         decisions=[],
         open_questions=[],
-        affordances=MedallionAffordances(),
+        affordances=MedallionAffordances.model_construct(),
     )
 
 
+# Serialized once at import; model_validate_json rebuilds an independent, validated
+# copy in pydantic-core without going through per-field Python construction
+_SAMPLE_MEDALLION_JSON = _build_sample_medallion().model_dump_json().encode()
+
+
+@pytest.fixture(scope="module")
+def sample_medallion() -> Medallion:
+    """Create a sample medallion for testing."""
+    return Medallion.model_validate_json(_SAMPLE_MEDALLION_JSON)
+
+
+@pytest.fixture(scope="module")
+def updated_medallion(sample_medallion: Medallion) -> Medallion:
+    """Result of the mocked LLM update: a copy identical to sample_medallion."""
+    return sample_medallion.model_copy()
+
+
 class TestCheckpointSessionNewScope:
     """Tests for checkpoint_session with new scope (no existing medallion)."""
 
-    @pytest.mark.asyncio
     async def test_checkpoint_session_creates_new_medallion(
         self,
         mock_store: MedallionStore,
@@ -123,89 +189,10 @@ class TestCheckpointSessionNewScope:
         # Verify result
         assert result == sample_medallion
 
-    def test_checkpoint_session_sync_wrapper(
-        self,
-        mock_store: MedallionStore,
-        mock_llm: MedallionLLM,
-        sample_scope: MedallionScope,
-        sample_evidence: Evidence,
-        sample_medallion: Medallion,
-    ) -> None:
-        """Test that checkpoint_session sync wrapper works (non-async context)."""
-        # Note: Testing sync wrapper in sync context (not from async test)
-        # The sync wrapper uses asyncio.run(), which cannot be called from async context
-        # In real usage, sync wrappers are called from sync code, not from async tests
-        mock_store.get_latest_for_scope.return_value = []
-        mock_llm.generate.return_value = sample_medallion
-
-        # This will work in sync context (not from async test)
-        result = checkpoint_session(
-            mock_store, mock_llm, sample_scope, sample_evidence
-        )
-
-        assert result == sample_medallion
-        mock_store.create.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_checkpoint_session_handles_llm_error(
-        self,
-        mock_store: MedallionStore,
-        mock_llm: MedallionLLM,
-        sample_scope: MedallionScope,
-        sample_evidence: Evidence,
-    ) -> None:
-        """Test that checkpoint_session handles LLM errors."""
-        mock_store.get_latest_for_scope.return_value = []
-        mock_llm.generate.side_effect = LLMError("LLM failed")
-
-        with pytest.raises(LLMError, match="Failed to generate medallion"):
-            await _checkpoint_session_async(
-                mock_store, mock_llm, sample_scope, sample_evidence
-            )
-
-    @pytest.mark.asyncio
-    async def test_checkpoint_session_handles_store_error_on_create(
-        self,
-        mock_store: MedallionStore,
-        mock_llm: MedallionLLM,
-        sample_scope: MedallionScope,
-        sample_evidence: Evidence,
-        sample_medallion: Medallion,
-    ) -> None:
-        """Test that checkpoint_session handles store errors on create."""
-        mock_store.get_latest_for_scope.return_value = []
-        mock_llm.generate.return_value = sample_medallion
-        mock_store.create.side_effect = StoreError("Store failed")
-
-        with pytest.raises(StoreError, match="Failed to create medallion"):
-            await _checkpoint_session_async(
-                mock_store, mock_llm, sample_scope, sample_evidence
-            )
-
-    @pytest.mark.asyncio
-    async def test_checkpoint_session_handles_schema_validation_error_on_create(
-        self,
-        mock_store: MedallionStore,
-        mock_llm: MedallionLLM,
-        sample_scope: MedallionScope,
-        sample_evidence: Evidence,
-        sample_medallion: Medallion,
-    ) -> None:
-        """Test that checkpoint_session handles schema validation errors on create."""
-        mock_store.get_latest_for_scope.return_value = []
-        mock_llm.generate.return_value = sample_medallion
-        mock_store.create.side_effect = SchemaValidationError("Schema invalid")
-
-        with pytest.raises(SchemaValidationError, match="Generated medallion schema validation failed"):
-            await _checkpoint_session_async(
-                mock_store, mock_llm, sample_scope, sample_evidence
-            )
-
 
 class TestCheckpointSessionExistingMedallion:
     """Tests for checkpoint_session with existing medallion."""
 
-    @pytest.mark.asyncio
     async def test_checkpoint_session_updates_existing_medallion(
         self,
         mock_store: MedallionStore,
@@ -213,19 +200,12 @@ class TestCheckpointSessionExistingMedallion:
         sample_scope: MedallionScope,
         sample_evidence: Evidence,
         sample_medallion: Medallion,
+        updated_medallion: Medallion,
     ) -> None:
         """Test that checkpoint_session updates existing medallion."""
         # Mock: Existing medallion found
         mock_store.get_latest_for_scope.return_value = [sample_medallion]
         # Mock: LLM updates medallion
-        updated_medallion = Medallion(
-            meta=sample_medallion.meta,
-            scope=sample_medallion.scope,
-            summary=sample_medallion.summary,
-            decisions=sample_medallion.decisions,
-            open_questions=sample_medallion.open_questions,
-            affordances=sample_medallion.affordances,
-        )
         mock_llm.update.return_value = updated_medallion
 
         result = await _checkpoint_session_async(
@@ -243,7 +223,6 @@ class TestCheckpointSessionExistingMedallion:
         # Verify result
         assert result == updated_medallion
 
-    @pytest.mark.asyncio
     async def test_checkpoint_session_uses_most_recent_medallion(
         self,
         mock_store: MedallionStore,
@@ -252,33 +231,32 @@ class TestCheckpointSessionExistingMedallion:
         sample_evidence: Evidence,
     ) -> None:
         """Test that checkpoint_session uses most recent medallion if multiple exist."""
-        now = datetime.now()
         # Create two medallions (most recent first)
-        medallion1 = Medallion(
-            meta=MedallionMeta(
+        medallion1 = Medallion.model_construct(
+            meta=MedallionMeta.model_construct(
                 medallion_id="med-001",
                 model="gpt-4",
-                created_at=now,
-                updated_at=now,
+                created_at=_NOW,
+                updated_at=_NOW,
             ),
             scope=sample_scope,
-            summary=MedallionSummary(high_level="Recent", subsystems=[]),
+            summary=MedallionSummary.model_construct(high_level="Recent", subsystems=[]),
             decisions=[],
             open_questions=[],
-            affordances=MedallionAffordances(),
+            affordances=MedallionAffordances.model_construct(),
         )
-        medallion2 = Medallion(
-            meta=MedallionMeta(
+        medallion2 = Medallion.model_construct(
+            meta=MedallionMeta.model_construct(
                 medallion_id="med-002",
                 model="gpt-4",
-                created_at=now,
-                updated_at=now,
+                created_at=_NOW,
+                updated_at=_NOW,
             ),
             scope=sample_scope,
-            summary=MedallionSummary(high_level="Older", subsystems=[]),
+            summary=MedallionSummary.model_construct(high_level="Older", subsystems=[]),
             decisions=[],
             open_questions=[],
-            affordances=MedallionAffordances(),
+            affordances=MedallionAffordances.model_construct(),
         )
         mock_store.get_latest_for_scope.return_value = [medallion1, medallion2]
         mock_llm.update.return_value = medallion1
@@ -290,113 +268,201 @@ class TestCheckpointSessionExistingMedallion:
         # Verify update was called with most recent (first) medallion
         mock_llm.update.assert_called_once_with(medallion1, sample_evidence)
 
-    @pytest.mark.asyncio
-    async def test_checkpoint_session_handles_llm_error_on_update(
+    async def test_checkpoint_session_handles_unexpected_error(
         self,
         mock_store: MedallionStore,
         mock_llm: MedallionLLM,
         sample_scope: MedallionScope,
         sample_evidence: Evidence,
-        sample_medallion: Medallion,
     ) -> None:
-        """Test that checkpoint_session handles LLM errors on update."""
-        mock_store.get_latest_for_scope.return_value = [sample_medallion]
-        mock_llm.update.side_effect = LLMError("LLM update failed")
+        """Test that checkpoint_session wraps unexpected errors."""
+        # Raise an unexpected exception
+        mock_store.get_latest_for_scope.side_effect = ValueError("Unexpected error")
 
-        with pytest.raises(LLMError, match="Failed to update medallion"):
+        with pytest.raises(StoreError, match=_RE_UNEXPECTED_CHECKPOINT):
             await _checkpoint_session_async(
                 mock_store, mock_llm, sample_scope, sample_evidence
             )
 
-    @pytest.mark.asyncio
-    async def test_checkpoint_session_handles_store_error_on_update(
+
+class TestCheckpointSessionErrors:
+    """Tests for checkpoint_session error wrapping on the create and update paths."""
+
+    @pytest.mark.parametrize(
+        ("has_existing", "failing_call", "error", "exc_cls", "match"),
+        [
+            pytest.param(
+                False,
+                "mock_llm.generate",
+                LLMError("LLM failed"),
+                LLMError,
+                _RE_FAILED_GENERATE,
+                id="llm-error-on-generate",
+            ),
+            pytest.param(
+                False,
+                "mock_store.create",
+                StoreError("Store failed"),
+                StoreError,
+                _RE_FAILED_CREATE,
+                id="store-error-on-create",
+            ),
+            pytest.param(
+                False,
+                "mock_store.create",
+                SchemaValidationError("Schema invalid"),
+                SchemaValidationError,
+                _RE_GENERATED_SCHEMA,
+                id="schema-error-on-create",
+            ),
+            pytest.param(
+                True,
+                "mock_llm.update",
+                LLMError("LLM update failed"),
+                LLMError,
+                _RE_FAILED_UPDATE,
+                id="llm-error-on-update",
+            ),
+            pytest.param(
+                True,
+                "mock_store.update",
+                StoreError("Store update failed"),
+                StoreError,
+                _RE_FAILED_STORE_UPDATE,
+                id="store-error-on-update",
+            ),
+            pytest.param(
+                True,
+                "mock_store.update",
+                SchemaValidationError("Schema invalid"),
+                SchemaValidationError,
+                _RE_UPDATED_SCHEMA,
+                id="schema-error-on-update",
+            ),
+        ],
+    )
+    async def test_checkpoint_session_wraps_errors(
         self,
         mock_store: MedallionStore,
         mock_llm: MedallionLLM,
         sample_scope: MedallionScope,
         sample_evidence: Evidence,
         sample_medallion: Medallion,
+        updated_medallion: Medallion,
+        has_existing: bool,
+        failing_call: str,
+        error: Exception,
+        exc_cls: type[Exception],
+        match: re.Pattern[str],
     ) -> None:
-        """Test that checkpoint_session handles store errors on update."""
-        mock_store.get_latest_for_scope.return_value = [sample_medallion]
-        updated_medallion = Medallion(
-            meta=sample_medallion.meta,
-            scope=sample_medallion.scope,
-            summary=sample_medallion.summary,
-            decisions=sample_medallion.decisions,
-            open_questions=sample_medallion.open_questions,
-            affordances=sample_medallion.affordances,
-        )
+        """Test that checkpoint_session wraps errors raised on each path."""
+        mock_store.get_latest_for_scope.return_value = [sample_medallion] if has_existing else []
+        mock_llm.generate.return_value = sample_medallion
         mock_llm.update.return_value = updated_medallion
-        mock_store.update.side_effect = StoreError("Store update failed")
+        mocks = {"mock_store": mock_store, "mock_llm": mock_llm}
+        owner, method = failing_call.split(".")
+        getattr(mocks[owner], method).side_effect = error
 
-        with pytest.raises(StoreError, match="Failed to update medallion in store"):
+        with pytest.raises(exc_cls, match=match):
             await _checkpoint_session_async(
                 mock_store, mock_llm, sample_scope, sample_evidence
             )
 
-    @pytest.mark.asyncio
-    async def test_checkpoint_session_handles_schema_validation_error_on_update(
+
+class TestLoadMedallionsForScope:
+    """Tests for load_medallions_for_scope."""
+
+    @pytest.mark.parametrize(
+        ("has_results", "limit_args", "expected_limit"),
+        [
+            pytest.param(True, (5,), 5, id="returns-store-results"),
+            # No limit argument: the default of 10 is forwarded
+            pytest.param(False, (), 10, id="handles-empty-result"),
+        ],
+    )
+    async def test_load_medallions_for_scope_returns_store_results(
         self,
         mock_store: MedallionStore,
-        mock_llm: MedallionLLM,
         sample_scope: MedallionScope,
-        sample_evidence: Evidence,
         sample_medallion: Medallion,
+        has_results: bool,
+        limit_args: tuple[int, ...],
+        expected_limit: int,
     ) -> None:
-        """Test that checkpoint_session handles schema validation errors on update."""
-        mock_store.get_latest_for_scope.return_value = [sample_medallion]
-        updated_medallion = Medallion(
-            meta=sample_medallion.meta,
-            scope=sample_medallion.scope,
-            summary=sample_medallion.summary,
-            decisions=sample_medallion.decisions,
-            open_questions=sample_medallion.open_questions,
-            affordances=sample_medallion.affordances,
-        )
-        mock_llm.update.return_value = updated_medallion
-        mock_store.update.side_effect = SchemaValidationError("Schema invalid")
+        """Test that load_medallions_for_scope returns what store.get_latest_for_scope returns."""
+        expected = [sample_medallion] if has_results else []
+        mock_store.get_latest_for_scope.return_value = expected
 
-        with pytest.raises(SchemaValidationError, match="Updated medallion schema validation failed"):
-            await _checkpoint_session_async(
-                mock_store, mock_llm, sample_scope, sample_evidence
-            )
+        result = await _load_medallions_for_scope_async(mock_store, sample_scope, *limit_args)
 
-    @pytest.mark.asyncio
-    async def test_checkpoint_session_handles_unexpected_error(
+        mock_store.get_latest_for_scope.assert_called_once_with(
+            sample_scope, limit=expected_limit
+        )
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        ("error", "match"),
+        [
+            # StoreError is re-raised as-is, not wrapped
+            pytest.param(StoreError("Store failed"), _RE_STORE_FAILED, id="store-error"),
+            pytest.param(
+                ValueError("Unexpected error"),
+                _RE_UNEXPECTED_LOAD,
+                id="unexpected-error",
+            ),
+        ],
+    )
+    async def test_load_medallions_for_scope_raises_store_error(
         self,
         mock_store: MedallionStore,
-        mock_llm: MedallionLLM,
         sample_scope: MedallionScope,
-        sample_evidence: Evidence,
+        error: Exception,
+        match: re.Pattern[str],
     ) -> None:
-        """Test that checkpoint_session wraps unexpected errors."""
-        # Raise an unexpected exception
-        mock_store.get_latest_for_scope.side_effect = ValueError("Unexpected error")
+        """Test that load_medallions_for_scope surfaces failures as StoreError."""
+        mock_store.get_latest_for_scope.side_effect = error
 
-        with pytest.raises(StoreError, match="Unexpected error during checkpoint_session"):
-            await _checkpoint_session_async(
-                mock_store, mock_llm, sample_scope, sample_evidence
-            )
+        with pytest.raises(StoreError, match=match):
+            await _load_medallions_for_scope_async(mock_store, sample_scope)
 
 
-class TestLoadMedallionsForScope:
-    """Tests for load_medallions_for_scope."""
+@pytest.fixture(scope="module")
+def _sync_wrapper_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """One event loop for every sync-wrapper call instead of one per asyncio.run()."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+class TestSyncWrappers:
+    """Tests for the synchronous checkpoint_session / load_medallions_for_scope wrappers."""
 
-    @pytest.mark.asyncio
-    async def test_load_medallions_for_scope_calls_store(
+    @pytest.fixture(autouse=True)
+    def _run_on_shared_loop(
+        self, monkeypatch: pytest.MonkeyPatch, _sync_wrapper_loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Route the wrappers' asyncio.run() onto the shared module loop."""
+        # Rebind only session.py's asyncio name; the real asyncio.run stays untouched
+        monkeypatch.setattr(
+            session_module, "asyncio", SimpleNamespace(run=_sync_wrapper_loop.run_until_complete)
+        )
+
+    def test_checkpoint_session_sync_wrapper(
         self,
         mock_store: MedallionStore,
+        mock_llm: MedallionLLM,
         sample_scope: MedallionScope,
+        sample_evidence: Evidence,
         sample_medallion: Medallion,
     ) -> None:
-        """Test that load_medallions_for_scope calls store.get_latest_for_scope."""
-        mock_store.get_latest_for_scope.return_value = [sample_medallion]
+        """Test that checkpoint_session sync wrapper works (non-async context)."""
+        mock_store.get_latest_for_scope.return_value = []
+        mock_llm.generate.return_value = sample_medallion
 
-        result = await _load_medallions_for_scope_async(mock_store, sample_scope, 10)
+        result = checkpoint_session(mock_store, mock_llm, sample_scope, sample_evidence)
 
-        mock_store.get_latest_for_scope.assert_called_once_with(sample_scope, limit=10)
-        assert result == [sample_medallion]
+        assert result == sample_medallion
+        mock_store.create.assert_called_once()
 
     def test_load_medallions_for_scope_sync_wrapper(
         self,
@@ -405,84 +471,61 @@ class TestLoadMedallionsForScope:
         sample_medallion: Medallion,
     ) -> None:
         """Test that load_medallions_for_scope sync wrapper works (non-async context)."""
-        # Note: Testing sync wrapper in sync context (not from async test)
-        # The sync wrapper uses asyncio.run(), which cannot be called from async context
-        # In real usage, sync wrappers are called from sync code, not from async tests
         mock_store.get_latest_for_scope.return_value = [sample_medallion]
 
         result = load_medallions_for_scope(mock_store, sample_scope, 10)
 
         assert result == [sample_medallion]
 
-    @pytest.mark.asyncio
-    async def test_load_medallions_for_scope_handles_empty_result(
-        self, mock_store: MedallionStore, sample_scope: MedallionScope
-    ) -> None:
-        """Test that load_medallions_for_scope handles empty results."""
-        mock_store.get_latest_for_scope.return_value = []
 
-        result = await _load_medallions_for_scope_async(mock_store, sample_scope)
-
-        assert result == []
-
-    @pytest.mark.asyncio
-    async def test_load_medallions_for_scope_handles_store_error(
-        self, mock_store: MedallionStore, sample_scope: MedallionScope
-    ) -> None:
-        """Test that load_medallions_for_scope handles store errors."""
-        mock_store.get_latest_for_scope.side_effect = StoreError("Store failed")
-
-        # StoreError is re-raised as-is, not wrapped
-        with pytest.raises(StoreError, match="Store failed"):
-            await _load_medallions_for_scope_async(mock_store, sample_scope)
-
-    @pytest.mark.asyncio
-    async def test_load_medallions_for_scope_handles_unexpected_error(
-        self, mock_store: MedallionStore, sample_scope: MedallionScope
-    ) -> None:
-        """Test that load_medallions_for_scope wraps unexpected errors."""
-        # Use a non-StoreError exception to test wrapping
-        mock_store.get_latest_for_scope.side_effect = ValueError("Unexpected error")
-
-        with pytest.raises(StoreError, match="Unexpected error loading medallions"):
-            await _load_medallions_for_scope_async(mock_store, sample_scope)
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_sqlite_store() -> AsyncIterator[SQLiteMedallionStore]:
+    """Create one in-memory SQLite store so the schema DDL runs once per module."""
+    async with SQLiteMedallionStore(":memory:") as store:
+        yield store
 
 
 class TestCheckpointSessionIntegration:
     """Integration-style tests using real implementations."""
 
-    @pytest.mark.asyncio
+    @pytest_asyncio.fixture(autouse=True, loop_scope="module")
+    async def _truncate_store(self, shared_sqlite_store: SQLiteMedallionStore) -> None:
+        """Empty the shared store before each test (scope rows cascade)."""
+        assert shared_sqlite_store._conn is not None
+        await shared_sqlite_store._conn.execute("DELETE FROM medallions")
+        await shared_sqlite_store._conn.commit()
+
     async def test_checkpoint_session_end_to_end(
-        self, sample_scope: MedallionScope, sample_evidence: Evidence
+        self,
+        shared_sqlite_store: SQLiteMedallionStore,
+        sample_scope: MedallionScope,
+        sample_evidence: Evidence,
     ) -> None:
         """Test checkpoint_session with real SQLite store and stub LLM."""
-        from medallion.sqlite_store import SQLiteMedallionStore
-
-        async with SQLiteMedallionStore(":memory:") as store:
-            llm = StubMedallionLLM()
-
-            # First call - creates new medallion
-            medallion1 = await _checkpoint_session_async(
-                store, llm, sample_scope, sample_evidence
-            )
-            assert medallion1.meta.medallion_id.startswith("med-")
-            assert medallion1.meta.status == "active"
-
-            # Verify it was persisted
-            retrieved = await store.get_by_id(medallion1.meta.medallion_id)
-            assert retrieved is not None
-            assert retrieved.meta.medallion_id == medallion1.meta.medallion_id
-
-            # Second call - updates existing medallion
-            new_evidence = Evidence(
-                session_summary="Updated summary",
-                transcripts=[],
-                artefacts={},
-            )
-            medallion2 = await _checkpoint_session_async(
-                store, llm, sample_scope, new_evidence
-            )
-            assert medallion2.meta.medallion_id == medallion1.meta.medallion_id
-            assert medallion2.meta.created_at == medallion1.meta.created_at
-            assert medallion2.meta.updated_at > medallion1.meta.updated_at
+        store = shared_sqlite_store
+        llm = StubMedallionLLM()
 
+        # First call - creates new medallion
+        medallion1 = await _checkpoint_session_async(
+            store, llm, sample_scope, sample_evidence
+        )
+        assert medallion1.meta.medallion_id.startswith("med-")
+        assert medallion1.meta.status == "active"
+
+        # Verify it was persisted
+        retrieved = await store.get_by_id(medallion1.meta.medallion_id)
+        assert retrieved is not None
+        assert retrieved.meta.medallion_id == medallion1.meta.medallion_id
+
+        # Second call - updates existing medallion
+        new_evidence = Evidence(
+            session_summary="Updated summary",
+            transcripts=[],
+            artefacts={},
+        )
+        medallion2 = await _checkpoint_session_async(
+            store, llm, sample_scope, new_evidence
+        )
+        assert medallion2.meta.medallion_id == medallion1.meta.medallion_id
+        assert medallion2.meta.created_at == medallion1.meta.created_at
+        assert medallion2.meta.updated_at > medallion1.meta.updated_at
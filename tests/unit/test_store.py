@@ -1,7 +1,12 @@
 """Interface contract tests for MedallionStore Protocol."""
 
-from datetime import datetime, timedelta
-from typing import List, Optional
+import inspect
+import re
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from datetime import UTC, datetime, timedelta, timezone
+from typing import List
 
 import pytest
 
@@ -15,27 +20,126 @@ from medallion.types import (
 )
 from medallion.store import MedallionStore
 
+# Fixed clock for deterministic timestamps; offsets from it give monotonic ordering
+_NOW = datetime(2025, 1, 1, 12, 0, 0)
+
+# pytest.raises(match=...) accepts compiled patterns; compile each message once
+_RE_ALREADY_EXISTS = re.compile("already exists")
+_RE_NOT_FOUND = re.compile("not found")
+
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_AWARE = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def _to_epoch_us(value: datetime) -> int:
+    """Return updated_at as epoch microseconds, the SQLite store's sort key (naive = UTC)."""
+    epoch = _EPOCH_NAIVE if value.tzinfo is None else _EPOCH_AWARE
+    return (value - epoch) // timedelta(microseconds=1)
+
+
+# Every async test in this module shares one event loop (and the module-scoped store)
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
 
 class MockMedallionStore:
     """Mock implementation of MedallionStore for testing Protocol conformance."""
 
-    def __init__(self) -> None:
-        """Initialize mock store with empty storage."""
+    def __init__(self, query_cache_size: int = 128) -> None:
+        """Initialize mock store with empty storage, scope indexes and query cache."""
         self._storage: dict[str, Medallion] = {}
+        # Bit position of each medallion in the posting bitmaps
+        self._slots: dict[str, int] = {}
+        # Inverted indexes: scope value -> bitmap (Python int) of medallion slots
+        self._by_node: dict[str, int] = {}
+        self._by_tag: dict[str, int] = {}
+        # Per-medallion (graph_nodes, tags) snapshots taken when it was indexed
+        self._scope_sets: dict[str, tuple[frozenset[str], frozenset[str]]] = {}
+        # updated_at as epoch microseconds, computed once per indexed revision
+        self._updated_us: dict[str, int] = {}
+        # (updated_at_us, medallion_id) pairs kept in ascending order
+        self._by_updated: list[tuple[int, str]] = []
+        # LRU of get_latest_for_scope results, emptied on every write
+        self._query_cache_size = query_cache_size
+        self._query_cache: OrderedDict[
+            tuple[frozenset[str], frozenset[str], int], tuple[Medallion, ...]
+        ] = OrderedDict()
+
+    def clear(self) -> None:
+        """Drop every stored medallion so the instance can be reused."""
+        self._storage.clear()
+        self._slots.clear()
+        self._by_node.clear()
+        self._by_tag.clear()
+        self._scope_sets.clear()
+        self._updated_us.clear()
+        self._by_updated.clear()
+        self._query_cache.clear()
+
+    def _index(self, medallion: Medallion) -> None:
+        """Add a medallion's scope values to the inverted indexes."""
+        medallion_id = medallion.meta.medallion_id
+        nodes = frozenset(medallion.scope.graph_nodes)
+        tags = frozenset(medallion.scope.tags)
+        self._scope_sets[medallion_id] = (nodes, tags)
+        bit = 1 << self._slots.setdefault(medallion_id, len(self._slots))
+        for node in nodes:
+            self._by_node[node] = self._by_node.get(node, 0) | bit
+        for tag in tags:
+            self._by_tag[tag] = self._by_tag.get(tag, 0) | bit
+        updated_us = _to_epoch_us(medallion.meta.updated_at)
+        self._updated_us[medallion_id] = updated_us
+        insort(self._by_updated, (updated_us, medallion_id))
+        self._query_cache.clear()
+
+    def _unindex(self, medallion: Medallion) -> None:
+        """Remove a medallion's scope values from the inverted indexes."""
+        medallion_id = medallion.meta.medallion_id
+        nodes, tags = self._scope_sets.pop(medallion_id)
+        keep = ~(1 << self._slots[medallion_id])
+        for index, values in ((self._by_node, nodes), (self._by_tag, tags)):
+            for value in values:
+                remaining = index[value] & keep
+                if remaining:
+                    index[value] = remaining
+                else:
+                    del index[value]
+        position = bisect_left(
+            self._by_updated, (self._updated_us.pop(medallion_id), medallion_id)
+        )
+        del self._by_updated[position]
 
     async def create(self, medallion: Medallion) -> None:
         """Mock create implementation."""
-        if medallion.meta.medallion_id in self._storage:
+        # One hash operation: setdefault only inserts when the ID is new, which
+        # shows up as a size change (identity can't tell a re-create of the same object)
+        size = len(self._storage)
+        self._storage.setdefault(medallion.meta.medallion_id, medallion)
+        if len(self._storage) == size:
             raise StoreError(f"Medallion {medallion.meta.medallion_id} already exists")
-        self._storage[medallion.meta.medallion_id] = medallion
+        self._index(medallion)
+
+    async def create_many(self, medallions: Sequence[Medallion]) -> None:
+        """Mock create_many implementation: stores every medallion or none."""
+        seen: set[str] = set()
+        for medallion in medallions:
+            medallion_id = medallion.meta.medallion_id
+            if medallion_id in self._storage or medallion_id in seen:
+                raise StoreError(f"Medallion {medallion_id} already exists")
+            seen.add(medallion_id)
+        for medallion in medallions:
+            self._storage[medallion.meta.medallion_id] = medallion
+            self._index(medallion)
 
     async def update(self, medallion: Medallion) -> None:
         """Mock update implementation."""
-        if medallion.meta.medallion_id not in self._storage:
+        previous = self._storage.get(medallion.meta.medallion_id)
+        if previous is None:
             raise StoreError(f"Medallion {medallion.meta.medallion_id} not found")
+        self._unindex(previous)
         self._storage[medallion.meta.medallion_id] = medallion
+        self._index(medallion)
 
-    async def get_by_id(self, medallion_id: str) -> Optional[Medallion]:
+    async def get_by_id(self, medallion_id: str) -> Medallion | None:
         """Mock get_by_id implementation."""
         return self._storage.get(medallion_id)
 
@@ -45,74 +149,105 @@ class MockMedallionStore:
         limit: int = 10,
     ) -> List[Medallion]:
         """Mock get_latest_for_scope implementation."""
+        if limit <= 0:
+            return []
+
+        cache_key = (frozenset(scope.graph_nodes), frozenset(scope.tags), limit)
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            self._query_cache.move_to_end(cache_key)
+            return list(cached)
+
+        # None means "no constraint"; otherwise a bitmap of matching slots
+        candidates: int | None = None
+        if scope.graph_nodes:
+            # Subset matching for graph_nodes: AND the postings (-1 has every bit set)
+            candidates = -1
+            for node in scope.graph_nodes:
+                candidates &= self._by_node.get(node, 0)
+                if not candidates:
+                    return []
+        if scope.tags:
+            # Intersection matching for tags: OR the postings, any requested tag qualifies
+            tagged = 0
+            for tag in scope.tags:
+                tagged |= self._by_tag.get(tag, 0)
+            candidates = tagged if candidates is None else candidates & tagged
+            if not candidates:
+                return []
+
+        # Walk newest first (updated_at DESC) and stop once the limit is reached
         results: List[Medallion] = []
-        requested_nodes = set(scope.graph_nodes)
-        requested_tags = set(scope.tags)
+        for _, medallion_id in reversed(self._by_updated):
+            if candidates is None or candidates >> self._slots[medallion_id] & 1:
+                results.append(self._storage[medallion_id])
+                if len(results) == limit:
+                    break
+
+        if self._query_cache_size > 0:
+            self._query_cache[cache_key] = tuple(results)
+            if len(self._query_cache) > self._query_cache_size:
+                self._query_cache.popitem(last=False)
+        return results
+
+
+def _make_medallion(
+    medallion_id: str = "med-001",
+    *,
+    timestamp: datetime = _NOW,
+    graph_nodes: tuple[str, ...] = ("repo:muse",),
+    tags: tuple[str, ...] = ("project_state",),
+    high_level: str = "Test summary",
+) -> Medallion:
+    """Build a medallion without validation (inputs are known-good)."""
+    return Medallion.model_construct(
+        meta=MedallionMeta.model_construct(
+            medallion_id=medallion_id,
+            model="gpt-4",
+            created_at=timestamp,
+            updated_at=timestamp,
+        ),
+        scope=MedallionScope.model_construct(graph_nodes=graph_nodes, tags=tags),
+        summary=MedallionSummary.model_construct(high_level=high_level, subsystems=[]),
+        decisions=[],
+        open_questions=[],
+        affordances=MedallionAffordances.model_construct(),
+    )
+
+
+_TEMPLATE_MEDALLION = _make_medallion()
+
 
-        for medallion in self._storage.values():
-            stored_nodes = set(medallion.scope.graph_nodes)
-            stored_tags = set(medallion.scope.tags)
+def _timestamped_medallions(count: int) -> list[Medallion]:
+    """Build med-000, med-001, ... one second apart, oldest first."""
+    start = _TEMPLATE_MEDALLION.meta.created_at
+    return [
+        _make_medallion(f"med-{i:03d}", timestamp=start + timedelta(seconds=i))
+        for i in range(count)
+    ]
 
-            # Subset matching for graph_nodes
-            nodes_match = (
-                not requested_nodes or requested_nodes.issubset(stored_nodes)
-            )
-            # Intersection matching for tags
-            tags_match = (
-                not requested_tags or bool(requested_tags & stored_tags)
-            )
 
-            if nodes_match and tags_match:
-                results.append(medallion)
+@pytest.fixture(scope="module")
+def mock_store() -> MockMedallionStore:
+    """Create one mock store instance shared by the module."""
+    return MockMedallionStore()
 
-        # Sort by updated_at DESC
-        results.sort(key=lambda m: m.meta.updated_at, reverse=True)
-        return results[:limit] if limit > 0 else []
+
+@pytest.fixture(autouse=True)
+def _clear_mock_store(mock_store: MockMedallionStore) -> Iterator[None]:
+    """Empty the shared store after each test."""
+    yield
+    mock_store.clear()
 
 
 class TestMedallionStoreProtocol:
     """Tests verifying MedallionStore Protocol conformance."""
 
-    @pytest.fixture
-    def mock_store(self) -> MockMedallionStore:
-        """Create a mock store instance."""
-        return MockMedallionStore()
-
     @pytest.fixture
     def sample_medallion(self) -> Medallion:
-        """Create a sample medallion for testing."""
-        now = datetime.now()
-        meta = MedallionMeta(
-            medallion_id="med-001",
-            model="gpt-4",
-            created_at=now,
-            updated_at=now,
-        )
-        scope = MedallionScope(
-            graph_nodes=["repo:muse"],
-            tags=["project_state"],
-        )
-        summary = MedallionSummary(
-            high_level="Test summary",
-            subsystems=[],
-        )
-        affordances = MedallionAffordances()
-        return Medallion(
-            meta=meta,
-            scope=scope,
-            summary=summary,
-            decisions=[],
-            open_questions=[],
-            affordances=affordances,
-        )
+        """Return a shallow copy of the template medallion."""
+        return _TEMPLATE_MEDALLION.model_copy()
 
-    @pytest.mark.asyncio
-    async def test_create_method_exists(self, mock_store: MockMedallionStore) -> None:
-        """Test that create method exists and is async."""
-        assert hasattr(mock_store, "create")
-        assert callable(mock_store.create)
-
-    @pytest.mark.asyncio
     async def test_create_persists_medallion(
         self, mock_store: MockMedallionStore, sample_medallion: Medallion
     ) -> None:
@@ -122,22 +257,25 @@ class TestMedallionStoreProtocol:
         assert retrieved is not None
         assert retrieved.meta.medallion_id == "med-001"
 
-    @pytest.mark.asyncio
     async def test_create_raises_error_on_duplicate(
         self, mock_store: MockMedallionStore, sample_medallion: Medallion
     ) -> None:
         """Test that create raises StoreError on duplicate ID."""
         await mock_store.create(sample_medallion)
-        with pytest.raises(StoreError, match="already exists"):
+        with pytest.raises(StoreError, match=_RE_ALREADY_EXISTS):
             await mock_store.create(sample_medallion)
 
-    @pytest.mark.asyncio
-    async def test_update_method_exists(self, mock_store: MockMedallionStore) -> None:
-        """Test that update method exists and is async."""
-        assert hasattr(mock_store, "update")
-        assert callable(mock_store.update)
+    async def test_create_many_rejects_batch_with_duplicate(
+        self, mock_store: MockMedallionStore, sample_medallion: Medallion
+    ) -> None:
+        """Test that create_many stores nothing when any ID already exists."""
+        await mock_store.create(sample_medallion)
+        batch = _timestamped_medallions(2)
+
+        with pytest.raises(StoreError, match=_RE_ALREADY_EXISTS):
+            await mock_store.create_many(batch)
+        assert await mock_store.get_by_id(batch[0].meta.medallion_id) is None
 
-    @pytest.mark.asyncio
     async def test_update_modifies_existing_medallion(
         self, mock_store: MockMedallionStore, sample_medallion: Medallion
     ) -> None:
@@ -145,43 +283,48 @@ class TestMedallionStoreProtocol:
         await mock_store.create(sample_medallion)
 
         # Update the medallion
-        updated_meta = MedallionMeta(
-            medallion_id="med-001",
-            model="gpt-4",
-            created_at=sample_medallion.meta.created_at,
-            updated_at=datetime.now(),
-        )
-        updated_medallion = Medallion(
-            meta=updated_meta,
-            scope=sample_medallion.scope,
-            summary=sample_medallion.summary,
-            decisions=[],
-            open_questions=[],
-            affordances=sample_medallion.affordances,
+        updated_meta = sample_medallion.meta.model_copy(
+            update={"updated_at": sample_medallion.meta.updated_at + timedelta(seconds=1)}
         )
+        updated_medallion = sample_medallion.model_copy(update={"meta": updated_meta})
         await mock_store.update(updated_medallion)
 
         retrieved = await mock_store.get_by_id("med-001")
         assert retrieved is not None
         assert retrieved.meta.updated_at > sample_medallion.meta.updated_at
 
-    @pytest.mark.asyncio
+    async def test_update_reindexes_changed_scope(
+        self, mock_store: MockMedallionStore, sample_medallion: Medallion
+    ) -> None:
+        """Test that update moves a medallion from its old scope to its new one."""
+        await mock_store.create(sample_medallion)
+        new_scope = MedallionScope(graph_nodes=("repo:relocated",), tags=("moved",))
+        await mock_store.update(sample_medallion.model_copy(update={"scope": new_scope}))
+
+        assert await mock_store.get_latest_for_scope(sample_medallion.scope) == []
+        results = await mock_store.get_latest_for_scope(new_scope)
+        assert [m.meta.medallion_id for m in results] == ["med-001"]
+
+    async def test_update_handles_repeated_scope_values(
+        self, mock_store: MockMedallionStore, sample_medallion: Medallion
+    ) -> None:
+        """Test that a scope listing the same node or tag twice is indexed once."""
+        repeated = MedallionScope(
+            graph_nodes=("repo:muse", "repo:muse"), tags=("project_state", "project_state")
+        )
+        await mock_store.create(sample_medallion.model_copy(update={"scope": repeated}))
+        await mock_store.update(sample_medallion)
+
+        results = await mock_store.get_latest_for_scope(repeated)
+        assert [m.meta.medallion_id for m in results] == ["med-001"]
+
     async def test_update_raises_error_on_nonexistent(
         self, mock_store: MockMedallionStore, sample_medallion: Medallion
     ) -> None:
         """Test that update raises StoreError on nonexistent medallion."""
-        with pytest.raises(StoreError, match="not found"):
+        with pytest.raises(StoreError, match=_RE_NOT_FOUND):
             await mock_store.update(sample_medallion)
 
-    @pytest.mark.asyncio
-    async def test_get_by_id_method_exists(
-        self, mock_store: MockMedallionStore
-    ) -> None:
-        """Test that get_by_id method exists and is async."""
-        assert hasattr(mock_store, "get_by_id")
-        assert callable(mock_store.get_by_id)
-
-    @pytest.mark.asyncio
     async def test_get_by_id_returns_medallion(
         self, mock_store: MockMedallionStore, sample_medallion: Medallion
     ) -> None:
@@ -191,7 +334,6 @@ class TestMedallionStoreProtocol:
         assert retrieved is not None
         assert retrieved.meta.medallion_id == "med-001"
 
-    @pytest.mark.asyncio
     async def test_get_by_id_returns_none_for_nonexistent(
         self, mock_store: MockMedallionStore
     ) -> None:
@@ -199,15 +341,6 @@ class TestMedallionStoreProtocol:
         result = await mock_store.get_by_id("nonexistent")
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_get_latest_for_scope_method_exists(
-        self, mock_store: MockMedallionStore
-    ) -> None:
-        """Test that get_latest_for_scope method exists and is async."""
-        assert hasattr(mock_store, "get_latest_for_scope")
-        assert callable(mock_store.get_latest_for_scope)
-
-    @pytest.mark.asyncio
     async def test_get_latest_for_scope_exact_match(
         self, mock_store: MockMedallionStore, sample_medallion: Medallion
     ) -> None:
@@ -221,30 +354,13 @@ class TestMedallionStoreProtocol:
         assert len(results) == 1
         assert results[0].meta.medallion_id == "med-001"
 
-    @pytest.mark.asyncio
     async def test_get_latest_for_scope_subset_match(
         self, mock_store: MockMedallionStore
     ) -> None:
         """Test get_latest_for_scope with subset graph_nodes match."""
-        now = datetime.now()
         # Create medallion with multiple graph nodes
-        meta = MedallionMeta(
-            medallion_id="med-002",
-            model="gpt-4",
-            created_at=now,
-            updated_at=now,
-        )
-        scope_full = MedallionScope(
-            graph_nodes=["repo:muse", "module:cli"],
-            tags=["project_state"],
-        )
-        medallion = Medallion(
-            meta=meta,
-            scope=scope_full,
-            summary=MedallionSummary(high_level="Test", subsystems=[]),
-            decisions=[],
-            open_questions=[],
-            affordances=MedallionAffordances(),
+        medallion = _make_medallion(
+            "med-002", graph_nodes=("repo:muse", "module:cli"), high_level="Test"
         )
         await mock_store.create(medallion)
 
@@ -257,7 +373,6 @@ class TestMedallionStoreProtocol:
         assert len(results) == 1
         assert results[0].meta.medallion_id == "med-002"
 
-    @pytest.mark.asyncio
     async def test_get_latest_for_scope_returns_empty_for_no_matches(
         self, mock_store: MockMedallionStore
     ) -> None:
@@ -269,7 +384,17 @@ class TestMedallionStoreProtocol:
         results = await mock_store.get_latest_for_scope(scope)
         assert results == []
 
-    @pytest.mark.asyncio
+    async def test_get_latest_for_scope_requires_tag_overlap(
+        self, mock_store: MockMedallionStore, sample_medallion: Medallion
+    ) -> None:
+        """Test get_latest_for_scope excludes node matches that share no tag."""
+        await mock_store.create(sample_medallion)
+        matching = MedallionScope(graph_nodes=("repo:muse",), tags=("other", "project_state"))
+        disjoint = MedallionScope(graph_nodes=("repo:muse",), tags=("other",))
+
+        assert len(await mock_store.get_latest_for_scope(matching)) == 1
+        assert await mock_store.get_latest_for_scope(disjoint) == []
+
     async def test_get_latest_for_scope_returns_empty_for_empty_scope(
         self, mock_store: MockMedallionStore
     ) -> None:
@@ -278,71 +403,75 @@ class TestMedallionStoreProtocol:
         results = await mock_store.get_latest_for_scope(scope)
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_get_latest_for_scope_respects_limit(
         self, mock_store: MockMedallionStore
     ) -> None:
         """Test get_latest_for_scope respects limit parameter."""
-        now = datetime.now()
-        scope = MedallionScope(graph_nodes=["repo:muse"], tags=["project_state"])
-
         # Create 5 medallions with incrementing timestamps
-        for i in range(5):
-            meta = MedallionMeta(
-                medallion_id=f"med-{i:03d}",
-                model="gpt-4",
-                created_at=now + timedelta(seconds=i),
-                updated_at=now + timedelta(seconds=i),
-            )
-            medallion = Medallion(
-                meta=meta,
-                scope=scope,
-                summary=MedallionSummary(high_level=f"Summary {i}", subsystems=[]),
-                decisions=[],
-                open_questions=[],
-                affordances=MedallionAffordances(),
-            )
-            await mock_store.create(medallion)
+        await mock_store.create_many(_timestamped_medallions(5))
 
         # Query with limit
-        results = await mock_store.get_latest_for_scope(scope, limit=3)
+        results = await mock_store.get_latest_for_scope(_TEMPLATE_MEDALLION.scope, limit=3)
         assert len(results) == 3
 
-    @pytest.mark.asyncio
     async def test_get_latest_for_scope_orders_by_updated_at_desc(
         self, mock_store: MockMedallionStore
     ) -> None:
         """Test get_latest_for_scope orders results by updated_at DESC."""
-        now = datetime.now()
-        scope = MedallionScope(graph_nodes=["repo:muse"], tags=["project_state"])
-
         # Create medallions with different timestamps
-        for i in range(3):
-            timestamp = now + timedelta(seconds=i)
-            meta = MedallionMeta(
-                medallion_id=f"med-{i:03d}",
-                model="gpt-4",
-                created_at=timestamp,
-                updated_at=timestamp,
-            )
-            medallion = Medallion(
-                meta=meta,
-                scope=scope,
-                summary=MedallionSummary(high_level=f"Summary {i}", subsystems=[]),
-                decisions=[],
-                open_questions=[],
-                affordances=MedallionAffordances(),
-            )
-            await mock_store.create(medallion)
-
-        results = await mock_store.get_latest_for_scope(scope, limit=10)
+        await mock_store.create_many(_timestamped_medallions(3))
+
+        results = await mock_store.get_latest_for_scope(_TEMPLATE_MEDALLION.scope, limit=10)
         assert len(results) == 3
         # Should be ordered by updated_at DESC (latest first)
         assert results[0].meta.medallion_id == "med-002"
         assert results[1].meta.medallion_id == "med-001"
         assert results[2].meta.medallion_id == "med-000"
 
-    @pytest.mark.asyncio
+    async def test_get_latest_for_scope_orders_mixed_naive_and_aware(
+        self, mock_store: MockMedallionStore
+    ) -> None:
+        """Test that naive (UTC) and aware updated_at values order on one timeline."""
+        # 12:00 UTC, 13:00+02:00 (= 11:00 UTC) and naive 12:30 (treated as UTC)
+        await mock_store.create_many(
+            [
+                _make_medallion("med-utc", timestamp=_NOW.replace(tzinfo=UTC)),
+                _make_medallion(
+                    "med-plus2",
+                    timestamp=datetime(2025, 1, 1, 13, 0, tzinfo=timezone(timedelta(hours=2))),
+                ),
+                _make_medallion("med-naive", timestamp=_NOW + timedelta(minutes=30)),
+            ]
+        )
+
+        results = await mock_store.get_latest_for_scope(_TEMPLATE_MEDALLION.scope, limit=10)
+        assert [m.meta.medallion_id for m in results] == ["med-naive", "med-utc", "med-plus2"]
+
+    async def test_get_latest_for_scope_cache_invalidated_by_create(
+        self, mock_store: MockMedallionStore
+    ) -> None:
+        """Test that a cached query result is dropped once a new medallion is created."""
+        first, second = _timestamped_medallions(2)
+        await mock_store.create(first)
+        assert len(await mock_store.get_latest_for_scope(first.scope)) == 1
+
+        await mock_store.create(second)
+        results = await mock_store.get_latest_for_scope(first.scope)
+        assert [m.meta.medallion_id for m in results] == ["med-001", "med-000"]
+
+    async def test_get_latest_for_scope_cache_evicts_least_recent(self) -> None:
+        """Test that a full query cache evicts the least recently used entry."""
+        store = MockMedallionStore(query_cache_size=2)
+        await store.create(_TEMPLATE_MEDALLION)
+        scope = _TEMPLATE_MEDALLION.scope
+        await store.get_latest_for_scope(scope, limit=1)
+        await store.get_latest_for_scope(scope, limit=2)
+        # Touch limit=1 so limit=2 becomes least recent; FIFO would evict limit=1 instead
+        await store.get_latest_for_scope(scope, limit=1)
+        await store.get_latest_for_scope(scope, limit=3)
+
+        assert [key[2] for key in store._query_cache] == [1, 3]
+
     async def test_get_latest_for_scope_limit_zero_returns_empty(
         self, mock_store: MockMedallionStore, sample_medallion: Medallion
     ) -> None:
@@ -355,7 +484,6 @@ class TestMedallionStoreProtocol:
         results = await mock_store.get_latest_for_scope(scope, limit=0)
         assert results == []
 
-    @pytest.mark.asyncio
     async def test_get_latest_for_scope_negative_limit_returns_empty(
         self, mock_store: MockMedallionStore, sample_medallion: Medallion
     ) -> None:
@@ -368,6 +496,13 @@ class TestMedallionStoreProtocol:
         results = await mock_store.get_latest_for_scope(scope, limit=-1)
         assert results == []
 
+    @pytest.mark.parametrize(
+        "method", ["create", "update", "get_by_id", "get_latest_for_scope"]
+    )
+    def test_method_exists(self, mock_store: MockMedallionStore, method: str) -> None:
+        """Test that each MedallionStore method exists and is async."""
+        assert inspect.iscoroutinefunction(getattr(mock_store, method))
+
     def test_mock_store_satisfies_protocol(self) -> None:
         """Test that MockMedallionStore satisfies MedallionStore Protocol."""
         # This is a type check - if MockMedallionStore doesn't satisfy the Protocol,